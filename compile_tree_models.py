@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Offline Treelite compilation for tree-ensemble models.
+
+Run once to compile any tree-based .sav model (RandomForest, gradient
+boosting, ...) into a native shared object:
+
+    python compile_tree_models.py
+
+Each eligible ``<name>.sav`` becomes ``<name>.so`` next to it; the app
+prefers the compiled library when tl2cgen is installed. Treelite emits
+branchless, compiler-vectorized C for per-tree evaluation, replacing
+sklearn's Python-level traversal. Non-tree models (logistic regression,
+SVM) are reported and skipped.
+"""
+
+import pickle
+from pathlib import Path
+
+import tl2cgen
+import treelite
+
+MODEL_DIR = Path(__file__).resolve().parent / "saved models"
+
+
+def main() -> None:
+    sav_files = sorted(MODEL_DIR.glob("*.sav"))
+    if not sav_files:
+        print(f"No .sav files found in {MODEL_DIR}.")
+        return
+    for sav in sav_files:
+        with sav.open("rb") as f:
+            model = pickle.load(f)
+        try:
+            tl_model = treelite.sklearn.import_model(model)
+        except Exception:
+            print(f"Skipped {sav.name}: not a tree ensemble")
+            continue
+        libpath = sav.with_name(sav.name.replace(".sav", ".so"))
+        tl2cgen.export_lib(
+            tl_model,
+            toolchain="gcc",
+            libpath=str(libpath),
+            params={"parallel_comp": 4},
+        )
+        print(f"{sav.name} -> {libpath.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,201 +1,667 @@
-# -*- coding: utf-8 -*-
-"""
-Multiple Disease Prediction Streamlit App
-
-Clean, consolidated rewrite:
-- Uses pathlib and a safe loader to open model files from the local `saved models` folder
-- Records model load errors and displays descriptive status in the sidebar
-- Uses typed Streamlit inputs (`number_input`, `selectbox`) with sensible defaults
-- Wraps predictions with a safe helper that reports exceptions to the UI
-
-Place the three .sav files in the `saved models` directory next to this script:
- - diabetes_model.sav
- - heart_disease_model.sav
- - parkinsons_model.sav
-
-Run with:
-    python -m streamlit run "multiple disease pred.py"
-"""
-
-from pathlib import Path
-from typing import Optional, Dict
-import pickle
-import streamlit as st
-from streamlit_option_menu import option_menu
-import os
-import time
-
-
-# --- Configuration ---------------------------------------------------------
-BASE_DIR = Path(__file__).resolve().parent
-MODEL_DIR = BASE_DIR / "saved models"
-MODEL_ERRORS: Dict[str, str] = {}
-
-
-def _get_file_info(path: Path) -> str:
-    try:
-        stat = path.stat()
-        size_kb = stat.st_size / 1024
-        mtime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime))
-        return f"{size_kb:.1f} KB, modified {mtime}"
-    except Exception:
-        return "(no info)"
-
-
-def load_model(filename: str) -> Optional[object]:
-    """Load a pickled model from the saved models folder.
-
-    On error, record a descriptive message in MODEL_ERRORS and return None.
-    """
-    path = MODEL_DIR / filename
-    if not path.exists():
-        MODEL_ERRORS[filename] = f"File not found: {path}"
-        return None
-    try:
-        with path.open("rb") as f:
-            model = pickle.load(f)
-            return model
-    except Exception as e:
-        MODEL_ERRORS[filename] = str(e)
-        return None
-
-
-def safe_predict(model, features):
-    try:
-        return model.predict([features])
-    except Exception as e:
-        st.error(f"Model prediction failed: {e}")
-        return None
-
-
-# --- Load models at startup -----------------------------------------------
-DIABETES_FILE = "diabetes_model.sav"
-HEART_FILE = "heart_disease_model.sav"
-PARK_FILE = "parkinsons_model.sav"
-
-_diabetes_model = load_model(DIABETES_FILE)
-_heart_model = load_model(HEART_FILE)
-_park_model = load_model(PARK_FILE)
-
-
-# --- Sidebar: Navigation -----------------------------------
-with st.sidebar:
-    # Keep a compact navigation menu; model-status info intentionally removed
-    selected = option_menu(
-        "Multiple Disease Prediction System",
-        ["Diabetes Prediction", "Heart Disease Prediction", "Parkinsons Prediction"],
-        icons=["activity", "heart", "person"],
-        menu_icon="cast",
-        default_index=0,
-    )
-
-
-# --- Pages ---------------------------------------------------------------
-if selected == "Diabetes Prediction":
-    st.title("Diabetes Prediction using ML")
-
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        pregnancies = st.number_input("Number of Pregnancies", value=2, min_value=0, step=1)
-        skin = st.number_input("Skin Thickness", value=20, min_value=0, step=1)
-        dpf = st.number_input("Diabetes Pedigree Function", value=0.5, min_value=0.0, step=0.01, format="%.4f")
-    with c2:
-        glucose = st.number_input("Glucose Level", value=120, min_value=0, step=1)
-        insulin = st.number_input("Insulin Level", value=79.0, min_value=0.0, step=1.0)
-        age = st.number_input("Age", value=45, min_value=0, step=1)
-    with c3:
-        bp = st.number_input("Blood Pressure", value=70, min_value=0, step=1)
-        bmi = st.number_input("BMI", value=28.0, min_value=0.0, step=0.1)
-
-    if st.button("Diabetes Test Result"):
-        if _diabetes_model is None:
-            st.error("Diabetes model is not loaded. Check sidebar for details.")
-        else:
-            features = [pregnancies, glucose, bp, skin, insulin, bmi, dpf, age]
-            res = safe_predict(_diabetes_model, features)
-            if res is not None:
-                st.success("The person is diabetic" if int(res[0]) == 1 else "The person is not diabetic")
-
-
-if selected == "Heart Disease Prediction":
-    st.title("Heart Disease Prediction using ML")
-
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        age = st.number_input("Age", value=54, min_value=0, step=1)
-        trestbps = st.number_input("Resting Blood Pressure", value=130, min_value=0, step=1)
-        restecg = st.number_input("Resting ECG result", value=1, min_value=0, step=1)
-    with c2:
-        sex = st.number_input("Sex (0 = female, 1 = male)", value=1, min_value=0, max_value=1, step=1)
-        chol = st.number_input("Serum Cholesterol (mg/dl)", value=250, min_value=0, step=1)
-        thalach = st.number_input("Maximum Heart Rate achieved", value=150, min_value=0, step=1)
-    with c3:
-        cp = st.number_input("Chest Pain type (0-3)", value=3, min_value=0, step=1)
-        fbs = st.number_input("Fasting Blood Sugar > 120 mg/dl (0/1)", value=0, min_value=0, max_value=1, step=1)
-        exang = st.number_input("Exercise Induced Angina (0/1)", value=0, min_value=0, max_value=1, step=1)
-
-    oldpeak = st.number_input("ST depression induced by exercise", value=1.0, min_value=0.0, step=0.1)
-    slope = st.number_input("Slope of the peak exercise ST segment", value=2, min_value=0, step=1)
-    ca = st.number_input("Major vessels colored by flourosopy (0-3)", value=0, min_value=0, step=1)
-
-    thal_map = {"0 - normal": 0, "1 - fixed defect": 1, "2 - reversible defect": 2}
-    thal_label = st.selectbox("Thalassemia (thal)", list(thal_map.keys()), index=2)
-    thal = thal_map[thal_label]
-
-    if st.button("Heart Disease Test Result"):
-        if _heart_model is None:
-            st.error("Heart disease model is not loaded. Check sidebar for details.")
-        else:
-            features = [age, sex, cp, trestbps, chol, fbs, restecg, thalach, exang, oldpeak, slope, ca, thal]
-            res = safe_predict(_heart_model, features)
-            if res is not None:
-                st.success("The person is having heart disease" if int(res[0]) == 1 else "The person does not have any heart disease")
-
-
-if selected == "Parkinsons Prediction":
-    st.title("Parkinson's Disease Prediction using ML")
-
-    col1, col2, col3, col4, col5 = st.columns(5)
-    with col1:
-        fo = st.number_input('MDVP:Fo(Hz)', value=119.992, min_value=0.0, step=0.001, format="%.3f")
-        RAP = st.number_input('MDVP:RAP', value=0.00370, min_value=0.0, step=1e-6, format="%.6f")
-        APQ3 = st.number_input('Shimmer:APQ3', value=0.11, min_value=0.0, step=0.01, format="%.2f")
-        HNR = st.number_input('HNR', value=21.0, min_value=0.0, step=0.1)
-        D2 = st.number_input('D2', value=2.1, min_value=0.0, step=0.01)
-    with col2:
-        fhi = st.number_input('MDVP:Fhi(Hz)', value=157.302, min_value=0.0, step=0.001, format="%.3f")
-        PPQ = st.number_input('MDVP:PPQ', value=0.00401, min_value=0.0, step=1e-6, format="%.6f")
-        APQ5 = st.number_input('Shimmer:APQ5', value=0.16, min_value=0.0, step=0.01, format="%.2f")
-        RPDE = st.number_input('RPDE', value=0.65, min_value=0.0, step=0.01)
-        PPE = st.number_input('PPE', value=0.2, min_value=0.0, step=0.01)
-    with col3:
-        flo = st.number_input('MDVP:Flo(Hz)', value=74.997, min_value=0.0, step=0.001, format="%.3f")
-        DDP = st.number_input('Jitter:DDP', value=0.00631, min_value=0.0, step=1e-6, format="%.6f")
-        APQ = st.number_input('MDVP:APQ', value=0.14, min_value=0.0, step=0.01, format="%.2f")
-        DFA = st.number_input('DFA', value=0.71, min_value=0.0, step=0.01)
-    with col4:
-        Jitter_percent = st.number_input('MDVP:Jitter(%)', value=0.00784, min_value=0.0, step=1e-6, format="%.6f")
-        Shimmer = st.number_input('MDVP:Shimmer', value=0.24, min_value=0.0, step=0.01, format="%.2f")
-        DDA = st.number_input('Shimmer:DDA', value=0.17, min_value=0.0, step=0.01, format="%.2f")
-        spread1 = st.number_input('spread1', value=-4.0, step=0.1)
-    with col5:
-        Jitter_Abs = st.number_input('MDVP:Jitter(Abs)', value=0.00007, min_value=0.0, step=1e-7, format="%.7f")
-        Shimmer_dB = st.number_input('MDVP:Shimmer(dB)', value=2.0, min_value=0.0, step=0.1)
-        NHR = st.number_input('NHR', value=0.022, min_value=0.0, step=1e-4, format="%.4f")
-        spread2 = st.number_input('spread2', value=2.0, step=0.1)
-
-    if st.button("Parkinson's Test Result"):
-        if _park_model is None:
-            st.error("Parkinsons model is not loaded. Check sidebar for details.")
-        else:
-            features = [
-                fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP,
-                Shimmer, Shimmer_dB, APQ3, APQ5, APQ, DDA, NHR, HNR,
-                RPDE, DFA, spread1, spread2 if 'spread2' in locals() else 2.0, D2, PPE
-            ]
-            res = safe_predict(_park_model, features)
-            if res is not None:
-                st.success("The person has Parkinson's disease" if int(res[0]) == 1 else "The person does not have Parkinson's disease")
-
-
-
+# -*- coding: utf-8 -*-
+"""
+Multiple Disease Prediction Streamlit App
+
+Clean, consolidated rewrite:
+- Uses pathlib and a safe loader to open model files from the local `saved models` folder
+- Records model load errors and displays descriptive status in the sidebar
+- Uses typed Streamlit inputs (`number_input`, `selectbox`) with sensible defaults
+- Wraps predictions with a safe helper that reports exceptions to the UI
+
+Place the three .sav files in the `saved models` directory next to this script:
+ - diabetes_model.sav
+ - heart_disease_model.sav
+ - parkinsons_model.sav
+
+Run with:
+    python -m streamlit run "multiple disease pred.py"
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+import pickle
+import threading
+import joblib
+import numpy as np
+import streamlit as st
+import os
+import time
+
+# Optional ONNX Runtime acceleration: single-row predict through ORT's C++
+# kernels is several times faster than sklearn's Python dispatch. The app
+# falls back to the plain sklearn models when these packages are missing.
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+except ImportError:
+    convert_sklearn = None
+try:
+    from onnxconverter_common import float16 as _float16
+except ImportError:
+    _float16 = None
+# Optional skops serialization: a purpose-built sklearn format that loads
+# estimator attributes without generic pickle opcode dispatch and without
+# pickle's arbitrary-code-execution risk.
+try:
+    from skops import io as skops_io
+except ImportError:
+    skops_io = None
+# Optional Treelite-compiled tree ensembles (see compile_tree_models.py).
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
+# Optional numba JIT for binary linear models served from the sklearn tiers.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _linear_decision(x, w, b):
+        s = b
+        for i in range(w.size):
+            s += x[i] * w[i]
+        return s
+
+
+# --- Configuration ---------------------------------------------------------
+BASE_DIR = Path(__file__).resolve().parent
+MODEL_DIR = BASE_DIR / "saved models"
+MODEL_ERRORS: Dict[str, str] = {}
+
+
+def _get_file_info(path: Path) -> str:
+    try:
+        stat = path.stat()
+        size_kb = stat.st_size / 1024
+        mtime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime))
+        return f"{size_kb:.1f} KB, modified {mtime}"
+    except Exception:
+        return "(no info)"
+
+
+def _write_protocol5_copy(model: object, p5_path: Path) -> None:
+    """Re-dump a legacy pickle with pickle.HIGHEST_PROTOCOL.
+
+    The shipped .sav files were saved with an old protocol; protocol 5
+    opcodes are more compact and unpickle faster. Written atomically via
+    a temp file so a half-written copy never shadows the original.
+    """
+    try:
+        tmp = p5_path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(p5_path)
+    except Exception:
+        # Best-effort upgrade; the legacy file keeps working without it.
+        pass
+
+
+class _NumbaLinearPredictor:
+    """predict() adapter scoring a binary linear model with a JIT kernel.
+
+    coef_/intercept_ are extracted once at load time; each call is then a
+    straight-line compiled dot product instead of sklearn's generic
+    predict dispatch. ``cache=True`` on the kernel persists the compiled
+    object on disk, so the JIT cost is paid once per machine rather than
+    once per process.
+    """
+
+    def __init__(self, model):
+        self._classes = np.asarray(model.classes_)
+        self._w = np.ascontiguousarray(model.coef_, dtype=np.float64).ravel()
+        self._b = float(np.asarray(model.intercept_).ravel()[0])
+        # Reused typed row: np.copyto converts the float32 input buffer
+        # in place, so scoring allocates nothing per call. The predictor
+        # is shared across Streamlit sessions, so a lock keeps concurrent
+        # submits from interleaving on the row.
+        self._row = np.empty(self._w.size, dtype=np.float64)
+        self._lock = threading.Lock()
+
+    def predict(self, X):
+        rows = np.asarray(X).reshape(-1, self._w.size)
+        labels = np.empty(rows.shape[0], dtype=self._classes.dtype)
+        with self._lock:
+            for i in range(rows.shape[0]):
+                np.copyto(self._row, rows[i])
+                labels[i] = (
+                    self._classes[1]
+                    if _linear_decision(self._row, self._w, self._b) > 0.0
+                    else self._classes[0]
+                )
+        return labels
+
+
+def _maybe_jit_linear(model: object) -> object:
+    """Swap a binary linear model for the numba-compiled scorer.
+
+    Only engages when numba is installed and the estimator exposes a
+    single-row coef_ with two classes; anything else is returned as-is.
+    """
+    if njit is None:
+        return model
+    try:
+        coef = getattr(model, "coef_", None)
+        if coef is not None and coef.shape[0] == 1 and len(model.classes_) == 2:
+            return _NumbaLinearPredictor(model)
+    except Exception:
+        pass
+    return model
+
+
+class _TreelitePredictor:
+    """Minimal predict() adapter around a tl2cgen compiled-model Predictor.
+
+    The compiled library returns per-class probabilities; reduce them to
+    class labels so callers see the sklearn predict() surface.
+    """
+
+    def __init__(self, predictor):
+        self._predictor = predictor
+
+    def predict(self, X):
+        arr = np.asarray(X, dtype=np.float32)
+        out = np.asarray(self._predictor.predict(tl2cgen.DMatrix(arr)))
+        probs = out.reshape(arr.shape[0], -1)
+        if probs.shape[1] == 1:
+            # Single-column output: probability of the positive class.
+            return (probs[:, 0] > 0.5).astype(int)
+        return probs.argmax(axis=1)
+
+
+class _OnnxPredictor:
+    """Minimal predict() adapter around an onnxruntime InferenceSession.
+
+    Exposes the same ``predict(X) -> labels`` surface as an sklearn
+    estimator so the prediction path need not care which backend
+    produced the result.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._input_name = session.get_inputs()[0].name
+
+    def predict(self, X):
+        arr = np.asarray(X, dtype=np.float32)
+        return self._session.run(None, {self._input_name: arr})[0]
+
+
+def _session_options(optimization_level) -> "ort.SessionOptions":
+    """ORT session options tuned for single-row, multi-user serving.
+
+    One InferenceSession is shared across every Streamlit session via
+    the predictor cache, so the thread pools are pinned to one thread
+    with sequential execution: on microsecond-scale predictions the
+    spin/sync overhead of a parallel pool exceeds the kernel time, and
+    per-prediction parallelism would oversubscribe cores whenever
+    several users submit at once.
+    """
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = optimization_level
+    sess_options.intra_op_num_threads = 1
+    sess_options.inter_op_num_threads = 1
+    sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    return sess_options
+
+
+def _load_onnx(onnx_path: Path) -> _OnnxPredictor:
+    """Create an ORT CPU session, caching the optimized graph on disk.
+
+    The first session serializes the fully optimized graph to an
+    ``.opt.onnx`` sibling; later processes load that file with
+    optimization disabled, so graph compilation is paid once per
+    artifact instead of once per server start.
+    """
+    opt_path = onnx_path.with_name(onnx_path.name.replace(".onnx", ".opt.onnx"))
+    try:
+        onnx_mtime = onnx_path.stat().st_mtime
+    except OSError:
+        onnx_mtime = 0.0
+    if _is_fresh(opt_path, onnx_mtime):
+        try:
+            sess_options = _session_options(ort.GraphOptimizationLevel.ORT_DISABLE_ALL)
+            session = ort.InferenceSession(
+                str(opt_path), sess_options, providers=["CPUExecutionProvider"]
+            )
+            return _OnnxPredictor(session)
+        except Exception:
+            # A stale or corrupt optimized graph: rebuild it from source.
+            pass
+    sess_options = _session_options(ort.GraphOptimizationLevel.ORT_ENABLE_ALL)
+    sess_options.optimized_model_filepath = str(opt_path)
+    session = ort.InferenceSession(
+        str(onnx_path), sess_options, providers=["CPUExecutionProvider"]
+    )
+    return _OnnxPredictor(session)
+
+
+def _write_onnx_copy(model: object, onnx_path: Path) -> None:
+    """Convert an sklearn model to ONNX once and cache it next to the .sav.
+
+    Best-effort: models skl2onnx cannot convert simply keep using the
+    sklearn predict path.
+    """
+    if convert_sklearn is None or ort is None:
+        return
+    try:
+        n_features = int(model.n_features_in_)
+        onnx_model = convert_sklearn(
+            model, initial_types=[("X", FloatTensorType([None, n_features]))]
+        )
+        tmp = onnx_path.with_name(onnx_path.name + ".tmp")
+        tmp.write_bytes(onnx_model.SerializeToString())
+        tmp.replace(onnx_path)
+    except Exception:
+        return
+    if _float16 is None:
+        return
+    try:
+        # FP16 weights halve the bandwidth of the scoring kernels'
+        # weight loads; keep_io_types leaves the float32 input intact
+        # so the prediction path needs no changes.
+        fp16_model = _float16.convert_float_to_float16(onnx_model, keep_io_types=True)
+        fp16_path = onnx_path.with_name(onnx_path.name.replace(".onnx", ".fp16.onnx"))
+        tmp = fp16_path.with_name(fp16_path.name + ".tmp")
+        tmp.write_bytes(fp16_model.SerializeToString())
+        tmp.replace(fp16_path)
+    except Exception:
+        pass
+
+
+def _write_skops_copy(model: object, skops_path: Path) -> None:
+    """Dump a model to a .skops sibling for safer, faster loading.
+
+    Best-effort like the other artifact writers; estimators skops cannot
+    serialize keep loading from the joblib/pickle tiers.
+    """
+    if skops_io is None:
+        return
+    try:
+        tmp = skops_path.with_name(skops_path.name + ".tmp")
+        skops_io.dump(model, tmp)
+        tmp.replace(skops_path)
+    except Exception:
+        pass
+
+
+def _write_joblib_copy(model: object, joblib_path: Path) -> None:
+    """Dump a model to a .joblib sibling for memory-mapped loading.
+
+    joblib stores ndarray attributes (tree arrays, support vectors) in a
+    memmap-friendly layout, so later loads with ``mmap_mode='r'`` page
+    them in on demand instead of copying them into RSS. Left
+    uncompressed on purpose: compressed joblib files cannot be
+    memory-mapped.
+    """
+    try:
+        tmp = joblib_path.with_name(joblib_path.name + ".tmp")
+        joblib.dump(model, tmp)
+        tmp.replace(joblib_path)
+    except Exception:
+        # Best-effort upgrade; the pickle files keep working without it.
+        pass
+
+
+def _is_fresh(artifact: Path, source_mtime: float) -> bool:
+    """True when an artifact exists and is no older than the source .sav.
+
+    Derived artifacts carry no freshness information of their own, so an
+    operator who drops in a retrained .sav would otherwise keep being
+    served the old model from a stale sibling forever.
+    """
+    try:
+        return artifact.stat().st_mtime >= source_mtime
+    except OSError:
+        return False
+
+
+@st.cache_resource(show_spinner=False)
+def load_model(filename: str, source_mtime: float = 0.0) -> Tuple[Optional[object], Optional[str]]:
+    """Load a pickled model from the saved models folder.
+
+    Cached with st.cache_resource so each model is unpickled once per
+    process instead of on every Streamlit rerun; ``source_mtime`` (the
+    .sav's mtime, from _model_mtime) is part of the cache key so a
+    retrained model is picked up without a restart. Returns a
+    ``(model, error)`` tuple rather than mutating globals, so the cache
+    can safely store the outcome of a failed load as well.
+
+    Artifact preference: a Treelite-compiled ``.so`` (tree ensembles,
+    produced offline by ``compile_tree_models.py``), then an
+    ``.int8.onnx`` quantized model (``quantize_models.py``), then a
+    ``.fp16.onnx`` half-precision variant, then the ``.onnx`` sibling,
+    all served through ONNX Runtime when available;
+    then a ``.skops`` sibling (pickle-free sklearn format), then a
+    ``.joblib`` sibling (memory-mapped), then a ``.sav.p5`` protocol-5
+    copy, then the legacy ``.sav`` pickle. Faster artifacts are written
+    on first load from a slower tier, and any artifact older than the
+    source .sav is skipped and rebuilt from a fresher tier.
+    """
+    path = MODEL_DIR / filename
+    fp16_path = path.with_name(path.name.replace(".sav", ".fp16.onnx"))
+    so_path = path.with_name(path.name.replace(".sav", ".so"))
+    if tl2cgen is not None and _is_fresh(so_path, source_mtime):
+        try:
+            return _TreelitePredictor(tl2cgen.Predictor(str(so_path))), None
+        except Exception:
+            # A stale or incompatible .so must not mask the other tiers.
+            pass
+    onnx_path = path.with_name(path.name.replace(".sav", ".onnx"))
+    int8_path = path.with_name(path.name.replace(".sav", ".int8.onnx"))
+    if ort is not None:
+        for candidate in (int8_path, fp16_path, onnx_path):
+            if not _is_fresh(candidate, source_mtime):
+                continue
+            try:
+                return _load_onnx(candidate), None
+            except Exception:
+                # A stale or corrupt artifact must not mask the sklearn tiers.
+                continue
+    skops_path = path.with_name(path.name.replace(".sav", ".skops"))
+    if skops_io is not None and _is_fresh(skops_path, source_mtime):
+        try:
+            model = skops_io.load(skops_path)
+            _write_onnx_copy(model, onnx_path)
+            return _maybe_jit_linear(model), None
+        except Exception:
+            # A stale, corrupt or untrusted .skops must not mask the
+            # joblib/pickle tiers.
+            pass
+    joblib_path = path.with_name(path.name.replace(".sav", ".joblib"))
+    if _is_fresh(joblib_path, source_mtime):
+        try:
+            model = joblib.load(joblib_path, mmap_mode="r")
+            _write_skops_copy(model, skops_path)
+            _write_onnx_copy(model, onnx_path)
+            return _maybe_jit_linear(model), None
+        except Exception:
+            # A stale or corrupt .joblib must not mask the pickle files.
+            pass
+    p5_path = path.with_name(path.name + ".p5")
+    if _is_fresh(p5_path, source_mtime):
+        model, err = _load_pickle(p5_path)
+        if err is None:
+            _write_skops_copy(model, skops_path)
+            _write_joblib_copy(model, joblib_path)
+            _write_onnx_copy(model, onnx_path)
+            return _maybe_jit_linear(model), None
+        # A stale or corrupt .p5 must not mask a healthy legacy file.
+    if not path.exists():
+        return None, f"File not found: {path}"
+    model, err = _load_pickle(path)
+    if err is None:
+        _write_protocol5_copy(model, p5_path)
+        _write_skops_copy(model, skops_path)
+        _write_joblib_copy(model, joblib_path)
+        _write_onnx_copy(model, onnx_path)
+        model = _maybe_jit_linear(model)
+    return model, err
+
+
+def _load_pickle(path: Path) -> Tuple[Optional[object], Optional[str]]:
+    """Unpickle a file in one shot.
+
+    read_bytes() pulls the whole file in a single large read and hands
+    the C unpickler one contiguous bytes object, instead of the chunked
+    Python-level read(n) calls pickle.load makes through a file object.
+    """
+    try:
+        return pickle.loads(path.read_bytes()), None
+    except Exception as e:
+        return None, str(e)
+
+
+def get_model(filename: str) -> Optional[object]:
+    """Fetch a cached model, recording any load error in MODEL_ERRORS."""
+    model, err = load_model(filename, _model_mtime(filename))
+    if err is not None:
+        MODEL_ERRORS[filename] = err
+    return model
+
+
+def _build_specialized_predictor(model: object, n_features: int):
+    """Generate a per-model scoring function via runtime codegen.
+
+    The generated source unrolls the buffer fill into one assignment per
+    feature and binds the model into the function's globals, so a call
+    is straight-line code with no tuple iteration, no dict lookups and
+    no generic dispatch between the widget values and predict(). The
+    try/except keeps prediction failures surfacing as st.error messages.
+    """
+    fill = "\n".join(f"    buf[0, {i}] = v{i}" for i in range(n_features))
+    args = ", ".join(f"v{i}" for i in range(n_features))
+    src = (
+        f"def _specialized(buf, {args}):\n"
+        f"{fill}\n"
+        f"    try:\n"
+        f"        return int(_model.predict(buf)[0])\n"
+        f"    except Exception as e:\n"
+        f"        _st.error(f\"Model prediction failed: {{e}}\")\n"
+        f"        return None\n"
+    )
+    namespace = {"_model": model, "_st": st}
+    exec(compile(src, f"<specialized predictor ({n_features} features)>", "exec"), namespace)
+    return namespace["_specialized"]
+
+
+@st.cache_resource(show_spinner=False)
+def get_predictor(filename: str, source_mtime: float = 0.0):
+    """Specialized scorer for a model, codegen'd once per retrain.
+
+    Runs one throwaway predict on zeros before returning: the first
+    call through any backend pays one-off costs (ORT session touch,
+    numba JIT, page faults on memory-mapped weights), and doing it here
+    moves that latency out of the first user click.
+    """
+    model, err = load_model(filename, source_mtime)
+    if model is None or err is not None:
+        return None
+    n_features = _MODEL_FEATURES[filename]
+    predictor = _build_specialized_predictor(model, n_features)
+    try:
+        predictor(np.zeros((1, n_features), dtype=np.float32), *([0.0] * n_features))
+    except Exception:
+        pass
+    return predictor
+
+
+# --- Model files (loaded lazily, cached per process) -----------------------
+DIABETES_FILE = "diabetes_model.sav"
+HEART_FILE = "heart_disease_model.sav"
+PARK_FILE = "parkinsons_model.sav"
+
+def _model_mtime(filename: str) -> float:
+    """Mtime of the source .sav, used to invalidate cached predictions."""
+    try:
+        return (MODEL_DIR / filename).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_predict(filename: str, features: Tuple[float, ...], model_mtime: float) -> Optional[int]:
+    """Memoize the class label for repeated clicks with identical inputs.
+
+    Users often re-click the predict button without changing any widget;
+    keying on the feature tuple skips the model call entirely on a hit.
+    The model file's mtime is part of the key so swapping in a retrained
+    .sav invalidates stale entries. Returns None when prediction failed
+    (the specialized predictor has already shown the error).
+    """
+    predictor = get_predictor(filename, model_mtime)
+    if predictor is None:
+        return None
+    buf = np.empty((1, _MODEL_FEATURES[filename]), dtype=np.float32)
+    return predictor(buf, *features)
+
+
+# Feature count per model. The (1, n) float32 input row is allocated per
+# call: Streamlit serves each user session on its own thread, so a shared
+# row would let concurrent submits interleave fill and predict and serve
+# one user the other's label; at microsecond predict times the allocation
+# it would save is noise.
+_MODEL_FEATURES: Dict[str, int] = {
+    DIABETES_FILE: 8,
+    HEART_FILE: 13,
+    PARK_FILE: 22,
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_page_model(filename: str) -> bool:
+    """Warm one page's model cache in the background at selection time.
+
+    Only the selected page pays its model's load cost (a user who never
+    opens the Parkinsons page never loads that model); the fire-and-
+    forget worker keeps the page paint unblocked while the predictor
+    cache makes the warm-up and the click-time call share one build.
+    Cached itself so reruns after the first selection spawn no threads.
+    Warming the predictor (not just the model) also runs the throwaway
+    first predict, so the user's first click skips the backend's
+    one-off costs entirely.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.submit(get_predictor, filename, _model_mtime(filename))
+    executor.shutdown(wait=False)
+    return True
+
+
+# --- Sidebar: Navigation -----------------------------------
+# Native radio widget: streamlit_option_menu rendered a custom component
+# through an iframe bridge, adding a round-trip and a React mount to
+# every rerun; st.sidebar.radio has no component bridge.
+selected = st.sidebar.radio(
+    "Multiple Disease Prediction System",
+    ["Diabetes Prediction", "Heart Disease Prediction", "Parkinsons Prediction"],
+)
+
+
+# --- Pages ---------------------------------------------------------------
+if selected == "Diabetes Prediction":
+    _warm_page_model(DIABETES_FILE)
+    st.title("Diabetes Prediction using ML")
+
+    with st.form("diabetes_form"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            pregnancies = st.number_input("Number of Pregnancies", value=2, min_value=0, step=1)
+            skin = st.number_input("Skin Thickness", value=20, min_value=0, step=1)
+            dpf = st.number_input("Diabetes Pedigree Function", value=0.5, min_value=0.0, step=0.01, format="%.4f")
+        with c2:
+            glucose = st.number_input("Glucose Level", value=120, min_value=0, step=1)
+            insulin = st.number_input("Insulin Level", value=79.0, min_value=0.0, step=1.0)
+            age = st.number_input("Age", value=45, min_value=0, step=1)
+        with c3:
+            bp = st.number_input("Blood Pressure", value=70, min_value=0, step=1)
+            bmi = st.number_input("BMI", value=28.0, min_value=0.0, step=0.1)
+        submitted = st.form_submit_button("Diabetes Test Result")
+
+    if submitted:
+        model = get_model(DIABETES_FILE)
+        if model is None:
+            st.error("Diabetes model is not loaded. Check sidebar for details.")
+        else:
+            features = (pregnancies, glucose, bp, skin, insulin, bmi, dpf, age)
+            label = cached_predict(DIABETES_FILE, features, _model_mtime(DIABETES_FILE))
+            if label is not None:
+                st.success("The person is diabetic" if label == 1 else "The person is not diabetic")
+
+
+if selected == "Heart Disease Prediction":
+    _warm_page_model(HEART_FILE)
+    st.title("Heart Disease Prediction using ML")
+
+    with st.form("heart_form"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            age = st.number_input("Age", value=54, min_value=0, step=1)
+            trestbps = st.number_input("Resting Blood Pressure", value=130, min_value=0, step=1)
+            restecg = st.number_input("Resting ECG result", value=1, min_value=0, step=1)
+        with c2:
+            sex = st.number_input("Sex (0 = female, 1 = male)", value=1, min_value=0, max_value=1, step=1)
+            chol = st.number_input("Serum Cholesterol (mg/dl)", value=250, min_value=0, step=1)
+            thalach = st.number_input("Maximum Heart Rate achieved", value=150, min_value=0, step=1)
+        with c3:
+            cp = st.number_input("Chest Pain type (0-3)", value=3, min_value=0, step=1)
+            fbs = st.number_input("Fasting Blood Sugar > 120 mg/dl (0/1)", value=0, min_value=0, max_value=1, step=1)
+            exang = st.number_input("Exercise Induced Angina (0/1)", value=0, min_value=0, max_value=1, step=1)
+
+        oldpeak = st.number_input("ST depression induced by exercise", value=1.0, min_value=0.0, step=0.1)
+        slope = st.number_input("Slope of the peak exercise ST segment", value=2, min_value=0, step=1)
+        ca = st.number_input("Major vessels colored by flourosopy (0-3)", value=0, min_value=0, step=1)
+
+        thal_map = {"0 - normal": 0, "1 - fixed defect": 1, "2 - reversible defect": 2}
+        thal_label = st.selectbox("Thalassemia (thal)", list(thal_map.keys()), index=2)
+        thal = thal_map[thal_label]
+        submitted = st.form_submit_button("Heart Disease Test Result")
+
+    if submitted:
+        model = get_model(HEART_FILE)
+        if model is None:
+            st.error("Heart disease model is not loaded. Check sidebar for details.")
+        else:
+            features = (age, sex, cp, trestbps, chol, fbs, restecg, thalach, exang, oldpeak, slope, ca, thal)
+            label = cached_predict(HEART_FILE, features, _model_mtime(HEART_FILE))
+            if label is not None:
+                st.success("The person is having heart disease" if label == 1 else "The person does not have any heart disease")
+
+
+if selected == "Parkinsons Prediction":
+    _warm_page_model(PARK_FILE)
+    st.title("Parkinson's Disease Prediction using ML")
+
+    with st.form("parkinsons_form"):
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            fo = st.number_input('MDVP:Fo(Hz)', value=119.992, min_value=0.0, step=0.001, format="%.3f")
+            RAP = st.number_input('MDVP:RAP', value=0.00370, min_value=0.0, step=1e-6, format="%.6f")
+            APQ3 = st.number_input('Shimmer:APQ3', value=0.11, min_value=0.0, step=0.01, format="%.2f")
+            HNR = st.number_input('HNR', value=21.0, min_value=0.0, step=0.1)
+            D2 = st.number_input('D2', value=2.1, min_value=0.0, step=0.01)
+        with col2:
+            fhi = st.number_input('MDVP:Fhi(Hz)', value=157.302, min_value=0.0, step=0.001, format="%.3f")
+            PPQ = st.number_input('MDVP:PPQ', value=0.00401, min_value=0.0, step=1e-6, format="%.6f")
+            APQ5 = st.number_input('Shimmer:APQ5', value=0.16, min_value=0.0, step=0.01, format="%.2f")
+            RPDE = st.number_input('RPDE', value=0.65, min_value=0.0, step=0.01)
+            PPE = st.number_input('PPE', value=0.2, min_value=0.0, step=0.01)
+        with col3:
+            flo = st.number_input('MDVP:Flo(Hz)', value=74.997, min_value=0.0, step=0.001, format="%.3f")
+            DDP = st.number_input('Jitter:DDP', value=0.00631, min_value=0.0, step=1e-6, format="%.6f")
+            APQ = st.number_input('MDVP:APQ', value=0.14, min_value=0.0, step=0.01, format="%.2f")
+            DFA = st.number_input('DFA', value=0.71, min_value=0.0, step=0.01)
+        with col4:
+            Jitter_percent = st.number_input('MDVP:Jitter(%)', value=0.00784, min_value=0.0, step=1e-6, format="%.6f")
+            Shimmer = st.number_input('MDVP:Shimmer', value=0.24, min_value=0.0, step=0.01, format="%.2f")
+            DDA = st.number_input('Shimmer:DDA', value=0.17, min_value=0.0, step=0.01, format="%.2f")
+            spread1 = st.number_input('spread1', value=-4.0, step=0.1)
+        with col5:
+            Jitter_Abs = st.number_input('MDVP:Jitter(Abs)', value=0.00007, min_value=0.0, step=1e-7, format="%.7f")
+            Shimmer_dB = st.number_input('MDVP:Shimmer(dB)', value=2.0, min_value=0.0, step=0.1)
+            NHR = st.number_input('NHR', value=0.022, min_value=0.0, step=1e-4, format="%.4f")
+            spread2 = st.number_input('spread2', value=2.0, step=0.1)
+        submitted = st.form_submit_button("Parkinson's Test Result")
+
+    if submitted:
+        model = get_model(PARK_FILE)
+        if model is None:
+            st.error("Parkinsons model is not loaded. Check sidebar for details.")
+        else:
+            features = (
+                fo, fhi, flo, Jitter_percent, Jitter_Abs, RAP, PPQ, DDP,
+                Shimmer, Shimmer_dB, APQ3, APQ5, APQ, DDA, NHR, HNR,
+                RPDE, DFA, spread1, spread2 if 'spread2' in locals() else 2.0, D2, PPE
+            )
+            label = cached_predict(PARK_FILE, features, _model_mtime(PARK_FILE))
+            if label is not None:
+                st.success("The person has Parkinson's disease" if label == 1 else "The person does not have Parkinson's disease")
+
+
+